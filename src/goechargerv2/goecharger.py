@@ -5,6 +5,7 @@ from typing import Literal
 from json.decoder import JSONDecodeError
 import requests
 
+from .state_store import GoeChargerStateStore
 from .validations import validate_empty_string
 
 
@@ -186,8 +187,14 @@ class GoeChargerApi:
     via API calls.
     """
 
+    # pylint: disable=too-many-arguments
     def __init__(
-        self, host: str, token: str, timeout: int = 5, wait: bool = False
+        self,
+        host: str,
+        token: str,
+        timeout: int = 5,
+        wait: bool = False,
+        state_store: GoeChargerStateStore | None = None,
     ) -> None:
         validate_empty_string(host, "host")
         validate_empty_string(token, "token")
@@ -195,6 +202,7 @@ class GoeChargerApi:
         self.token: str = token
         self.timeout: int = timeout
         self.wait: bool = wait
+        self.state_store: GoeChargerStateStore | None = state_store
 
     GO_CAR_STATUS: dict[str, str] = {
         "1": "Charger ready, no car connected",
@@ -263,6 +271,14 @@ class GoeChargerApi:
                 timeout=self.timeout,
             )
             status = status_request.json()
+
+            if (
+                self.state_store is not None
+                and isinstance(status, dict)
+                and status.get("success") is not False
+            ):
+                self.state_store.save(self.host, status)
+
             return status
         except (
             requests.exceptions.ConnectTimeout,
@@ -317,7 +333,17 @@ class GoeChargerApi:
             if self.wait:
                 self.__verify_set_parameter(parameter, value, 5)
 
-            return GoeChargerStatusMapper().map_api_status_response(set_request.json())
+            response = set_request.json()
+
+            # only confirmed parameters are stored, go-e returns {"<key>": true} for them
+            if (
+                self.state_store is not None
+                and isinstance(response, dict)
+                and response.get(parameter) is True
+            ):
+                self.state_store.update(self.host, {parameter: value})
+
+            return GoeChargerStatusMapper().map_api_status_response(response)
         except (
             requests.exceptions.ConnectTimeout,
             requests.exceptions.ConnectionError,
@@ -384,6 +410,24 @@ class GoeChargerApi:
 
         raise ValueError(f"transaction status={status} is unsupported")
 
+    def request_cached_status(self) -> dict | None:
+        """
+        Retrieve the last known status from the state store without calling the API.
+        The response is marked with "cached": True and "cached_at" timestamp.
+        Returns None if there is no state store or no stored status for the charger.
+        """
+        if self.state_store is None:
+            return None
+
+        entry = self.state_store.get(self.host)
+        if entry is None:
+            return None
+
+        response = GoeChargerStatusMapper().map_api_status_response(entry["status"])
+        response["cached"] = True
+        response["cached_at"] = entry["timestamp"]
+        return response
+
     def request_status(self) -> dict:
         """
         Call the GET API to retrieve a car status.
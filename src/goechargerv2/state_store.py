@@ -0,0 +1,198 @@
+"""Go-eCharger state store module, persists the last known raw status on disk"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from .validations import validate_empty_string
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GoeChargerStateStore:
+    """
+    Optional on-disk store of the last known raw status per charger. Entries are
+    keyed by the charger serial number (sse) or by the host if the serial number
+    is not known yet. The store allows returning a stale snapshot right after
+    a restart, before the charger has been polled again.
+
+    Changes are written to the disk at most once per flush_interval seconds,
+    call flush() or close() to write pending changes, e.g. on shutdown.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 10.0) -> None:
+        validate_empty_string(path, "path")
+        self.path: str = path
+        self.flush_interval: float = flush_interval
+        self.__lock = threading.Lock()
+        self.__entries: dict[str, dict] = {}
+        self.__hosts: dict[str, str] = {}
+        self.__dirty: bool = False
+        self.__last_flush: float | None = None
+        self.load()
+
+    def load(self) -> None:
+        """
+        Load the stored entries from the disk. A missing or corrupted file
+        results in an empty store.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except FileNotFoundError:
+            entries = {}
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Couldn't load state store %s: %s", self.path, err)
+            entries = {}
+
+        if not isinstance(entries, dict):
+            entries = {}
+
+        # drop malformed entries, so they can't break the lookups
+        entries = {
+            key: entry
+            for key, entry in entries.items()
+            if isinstance(entry, dict) and isinstance(entry.get("status"), dict)
+        }
+
+        with self.__lock:
+            self.__entries = entries
+            self.__hosts = {
+                entry["host"]: key
+                for key, entry in entries.items()
+                if isinstance(entry.get("host"), str)
+            }
+            self.__dirty = False
+
+    def __find_key(self, key: str) -> str | None:
+        """
+        Find the entry key either by the serial number or by the host.
+        """
+        if key in self.__entries:
+            return key
+
+        return self.__hosts.get(key)
+
+    def __mark_dirty(self) -> bool:
+        """
+        Mark the store as changed and return True if the flush interval elapsed.
+        Must be called with the lock held.
+        """
+        self.__dirty = True
+        return (
+            self.__last_flush is None
+            or time.monotonic() - self.__last_flush >= self.flush_interval
+        )
+
+    def flush(self) -> None:
+        """
+        Write pending changes to the disk, if there are any.
+        """
+        with self.__lock:
+            if not self.__dirty:
+                return
+
+            # failed writes keep the store dirty, so they are retried on the next flush
+            self.__dirty = not self.__write(self.__entries)
+            self.__last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Write pending changes to the disk before the store is discarded.
+        """
+        self.flush()
+
+    def __write(self, entries: dict) -> bool:
+        """
+        Atomically write all entries to the disk and return True on success.
+        Failures are logged, as the store must never break the API calls.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=directory)
+        except OSError as err:
+            _LOGGER.warning("Couldn't write state store %s: %s", self.path, err)
+            return False
+
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                json.dump(entries, file, separators=(",", ":"))
+            os.replace(temp_path, self.path)
+            return True
+        except (OSError, TypeError, ValueError) as err:
+            _LOGGER.warning("Couldn't write state store %s: %s", self.path, err)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+    def get(self, key: str) -> dict | None:
+        """
+        Get the stored entry by the serial number or the host.
+        Returns a dictionary with "host", "timestamp", "updated_at" and "status" keys
+        or None. The "timestamp" is the time of the last full status poll, "updated_at"
+        is the time of the last set call merged into the status.
+        """
+        with self.__lock:
+            entry_key = self.__find_key(key)
+            if entry_key is None:
+                return None
+
+            entry = self.__entries[entry_key]
+            return {
+                "host": entry.get("host"),
+                "timestamp": entry.get("timestamp"),
+                "updated_at": entry.get("updated_at"),
+                "status": dict(entry.get("status", {})),
+            }
+
+    def save(self, host: str, status: dict) -> None:
+        """
+        Store the raw status received from the charger together with the current timestamp.
+        """
+        key = str(status.get("sse") or host)
+
+        with self.__lock:
+            previous_key = self.__find_key(host)
+            if previous_key is not None and previous_key != key:
+                del self.__entries[previous_key]
+
+            previous_host = self.__entries.get(key, {}).get("host")
+            if previous_host is not None and previous_host != host:
+                self.__hosts.pop(previous_host, None)
+
+            self.__entries[key] = {
+                "host": host,
+                "timestamp": time.time(),
+                "status": dict(status),
+            }
+            self.__hosts[host] = key
+            should_flush = self.__mark_dirty()
+
+        if should_flush:
+            self.flush()
+
+    def update(self, host: str, values: dict) -> None:
+        """
+        Merge changed parameters into the stored raw status of the charger,
+        e.g. after a successful set call. Unknown chargers are ignored.
+        """
+        with self.__lock:
+            entry_key = self.__find_key(host)
+            if entry_key is None:
+                return
+
+            entry = self.__entries[entry_key]
+            self.__entries[entry_key] = dict(
+                entry,
+                status=dict(entry.get("status", {}), **values),
+                updated_at=time.time(),
+            )
+            should_flush = self.__mark_dirty()
+
+        if should_flush:
+            self.flush()
@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 
 from src.goechargerv2.goecharger import GoeChargerStatusMapper, GoeChargerApi
+from src.goechargerv2.state_store import GoeChargerStateStore
 
 
 REQUEST_RESPONSE = {
@@ -160,6 +161,19 @@ def mocked_requests_get(*args, **kwargs):
     return MockResponse(None, 404)
 
 
+# pylint: disable=unused-argument
+def mocked_requests_get_set_confirmation(*args, accepted=True, **kwargs):
+    """Module handling mocked API requests, which accept or reject every set request"""
+    response = mock.Mock()
+
+    if args[0].endswith("/api/set"):
+        response.json.return_value = {key: accepted for key in kwargs["params"]}
+    else:
+        response.json.return_value = REQUEST_RESPONSE
+
+    return response
+
+
 def test_status_mapping_response() -> None:
     """Test if response mapper correctly transforms property names"""
     status_mapper = GoeChargerStatusMapper()
@@ -224,3 +238,66 @@ def test_request_set_wait() -> None:
     # change transaction change
     changed_trx_2 = api.set_transaction(None)
     assert changed_trx_2["transaction"] is None
+
+
+@mock.patch(
+    "requests.get",
+    mock.Mock(side_effect=mocked_requests_get),
+)
+def test_request_cached_status(tmp_path) -> None:
+    """Test if the last known status is restored from the state store after a restart"""
+    path = str(tmp_path / "state.json")
+    api = GoeChargerApi("http://localhost:3000", "TOKEN")
+    assert api.request_cached_status() is None
+
+    api = GoeChargerApi(
+        "http://localhost:3000", "TOKEN", state_store=GoeChargerStateStore(path)
+    )
+    assert api.request_cached_status() is None
+    api.request_status()
+
+    restarted_api = GoeChargerApi(
+        "http://localhost:3000", "TOKEN", state_store=GoeChargerStateStore(path)
+    )
+    cached_status = restarted_api.request_cached_status()
+    assert cached_status.pop("cached") is True
+    assert isinstance(cached_status.pop("cached_at"), float)
+    assert cached_status == EXPECTED_MAPPED_RESPONSE
+
+
+@mock.patch(
+    "requests.get",
+    mock.Mock(
+        side_effect=partial(mocked_requests_get_set_confirmation, accepted=False)
+    ),
+)
+def test_request_set_rejected_not_cached(tmp_path) -> None:
+    """Test if a set rejected by the charger doesn't change the stored status"""
+    api = GoeChargerApi(
+        "http://localhost:3000",
+        "TOKEN",
+        state_store=GoeChargerStateStore(str(tmp_path / "state.json")),
+    )
+    api.request_status()
+    api.set_max_current(20)
+
+    assert api.request_cached_status()["charger_max_current"] == 6
+
+
+@mock.patch(
+    "requests.get",
+    mock.Mock(side_effect=mocked_requests_get_set_confirmation),
+)
+def test_request_set_cached(tmp_path) -> None:
+    """Test if a set confirmed by the charger updates the stored status"""
+    path = str(tmp_path / "state.json")
+    store = GoeChargerStateStore(path)
+    api = GoeChargerApi("http://localhost:3000", "TOKEN", state_store=store)
+    api.request_status()
+    api.set_max_current(20)
+    store.close()
+
+    restarted_api = GoeChargerApi(
+        "http://localhost:3000", "TOKEN", state_store=GoeChargerStateStore(path)
+    )
+    assert restarted_api.request_cached_status()["charger_max_current"] == 20
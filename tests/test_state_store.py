@@ -0,0 +1,101 @@
+"""Test cases for the Go-eCharger state store module"""
+
+from src.goechargerv2.state_store import GoeChargerStateStore
+
+
+def test_save_and_load(tmp_path) -> None:
+    """Test if the saved status is persisted and loaded by a new store instance"""
+    path = str(tmp_path / "state.json")
+    store = GoeChargerStateStore(path)
+    status = {"sse": "123", "amp": 6}
+    store.save("http://localhost:3000", status)
+    status["amp"] = 8
+    assert store.get("123")["status"] == {"sse": "123", "amp": 6}
+
+    restored = GoeChargerStateStore(path)
+    entry = restored.get("123")
+    assert entry["host"] == "http://localhost:3000"
+    assert entry["status"] == {"sse": "123", "amp": 6}
+    assert isinstance(entry["timestamp"], float)
+    assert restored.get("http://localhost:3000") == entry
+
+
+def test_save_replaces_host_key(tmp_path) -> None:
+    """Test if the host keyed entry is replaced once the serial number is known"""
+    store = GoeChargerStateStore(str(tmp_path / "state.json"))
+    store.save("http://localhost:3000", {"amp": 6})
+    assert store.get("http://localhost:3000")["status"] == {"amp": 6}
+
+    store.save("http://localhost:3000", {"sse": "123", "amp": 8})
+    assert store.get("123")["status"] == {"sse": "123", "amp": 8}
+    assert store.get("http://localhost:3000")["status"] == {"sse": "123", "amp": 8}
+
+
+def test_update(tmp_path) -> None:
+    """Test if set parameters are merged into the stored status"""
+    store = GoeChargerStateStore(str(tmp_path / "state.json"))
+    store.update("http://localhost:3000", {"amp": 10})
+    assert store.get("http://localhost:3000") is None
+
+    store.save("http://localhost:3000", {"sse": "123", "amp": 6, "frc": 0})
+    timestamp = store.get("123")["timestamp"]
+    assert store.get("123")["updated_at"] is None
+
+    store.update("http://localhost:3000", {"amp": 10})
+    entry = store.get("123")
+    assert entry["status"] == {"sse": "123", "amp": 10, "frc": 0}
+    assert entry["timestamp"] == timestamp
+    assert entry["updated_at"] >= timestamp
+
+
+def test_load_missing_or_corrupted(tmp_path) -> None:
+    """Test if a missing or corrupted file results in an empty store"""
+    assert GoeChargerStateStore(str(tmp_path / "missing.json")).get("123") is None
+
+    path = tmp_path / "corrupted.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert GoeChargerStateStore(str(path)).get("123") is None
+
+    path.write_text(
+        '{"x": 1, "y": {"status": 2}, "123": {"host": "h", "status": {"amp": 6}}}',
+        encoding="utf-8",
+    )
+    store = GoeChargerStateStore(str(path))
+    assert store.get("x") is None
+    assert store.get("y") is None
+    assert store.get("h")["status"] == {"amp": 6}
+
+
+def test_deferred_flush(tmp_path) -> None:
+    """Test if changes within the flush interval are written only on flush or close"""
+    path = str(tmp_path / "state.json")
+    store = GoeChargerStateStore(path, flush_interval=3600)
+    store.save("http://localhost:3000", {"sse": "123", "amp": 6})
+    store.save("http://localhost:3001", {"sse": "456", "amp": 8})
+    store.update("http://localhost:3000", {"amp": 10})
+
+    restored = GoeChargerStateStore(path)
+    assert restored.get("123")["status"] == {"sse": "123", "amp": 6}
+    assert restored.get("456") is None
+
+    store.close()
+    restored.load()
+    assert restored.get("123")["status"] == {"sse": "123", "amp": 10}
+    assert restored.get("http://localhost:3001")["status"] == {"sse": "456", "amp": 8}
+
+
+def test_write_failure_does_not_raise(tmp_path, caplog) -> None:
+    """Test if a write failure is logged, doesn't raise an error and is retried"""
+    directory = tmp_path / "missing"
+    path = str(directory / "state.json")
+    store = GoeChargerStateStore(path)
+    store.save("http://localhost:3000", {"sse": "123", "amp": 6})
+    store.update("http://localhost:3000", {"amp": 10})
+    store.close()
+
+    assert store.get("123")["status"] == {"sse": "123", "amp": 10}
+    assert f"Couldn't write state store {path}" in caplog.text
+
+    directory.mkdir()
+    store.close()
+    assert GoeChargerStateStore(path).get("123")["status"] == {"sse": "123", "amp": 10}